@@ -216,16 +216,17 @@ class DatasetCommand(command_base.Command):
         collab_by_api: t.Dict[str, t.List[CollaborationConfigBase]] = {}
         for collab_config in collabs:
             collab_by_api.setdefault(collab_config.api, []).append(collab_config)
-        by_type = {}
-        for s_type in signal_types:
-            by_signal: t.Dict[
-                str,
-                t.List[t.Tuple[str, FetchedSignalMetadata]],
-            ] = {}
-            for collabs_for_store in collab_by_api.values():
-                store = settings.fetched_state.get_for_collab(collabs_for_store[0])
-                by_collab = store.get_for_signal_type(collabs_for_store, s_type)
-                for collab, signals in by_collab.items():
+        s_types = list(signal_types)
+        by_type: t.Dict[
+            t.Type[SignalType],
+            t.Dict[str, t.List[t.Tuple[str, FetchedSignalMetadata]]],
+        ] = {s_type: {} for s_type in s_types}
+        for collabs_for_store in collab_by_api.values():
+            store = settings.fetched_state.get_for_collab(collabs_for_store[0])
+            by_collab = store.get_for_signal_types(collabs_for_store, s_types)
+            for collab, signals_by_type in by_collab.items():
+                for s_type, signals in signals_by_type.items():
+                    by_signal = by_type[s_type]
                     for signal, record in signals.items():
                         if self.only_tags:
                             for opinion in record.get_as_opinions():
@@ -234,7 +235,6 @@ class DatasetCommand(command_base.Command):
                             else:
                                 continue
                         by_signal.setdefault(signal, []).append((collab, record))
-            by_type[s_type] = by_signal
         return by_type
 
     def execute_print_summary(self, settings: CLISettings):
@@ -293,3 +293,24 @@ class FetchedStateStoreBase(ABC):
         sense.
         """
         raise NotImplementedError
+
+    def get_for_signal_types(
+        self,
+        collabs: t.List[CollaborationConfigBase],
+        signal_types: t.Sequence[t.Type[SignalType]],
+    ) -> t.Dict[str, t.Dict[t.Type[SignalType], t.Dict[str, FetchedSignalMetadata]]]:
+        """
+        Get as a map of CollabConfigBase.name() => SignalType => {signal: Metadata}
+
+        The default calls get_for_signal_type() once per type, which for
+        many implementations means one pass over the stored state per type.
+        Override if you can convert for all types in a single pass.
+        """
+        ret: t.Dict[
+            str, t.Dict[t.Type[SignalType], t.Dict[str, FetchedSignalMetadata]]
+        ] = {}
+        for signal_type in signal_types:
+            by_collab = self.get_for_signal_type(collabs, signal_type)
+            for collab_name, by_signal in by_collab.items():
+                ret.setdefault(collab_name, {})[signal_type] = by_signal
+        return ret
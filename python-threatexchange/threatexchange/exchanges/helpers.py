@@ -52,13 +52,16 @@ class _StateTracker:
     @delta.setter
     def delta(self, value: fetch_state.FetchDeltaTyped) -> None:
         if self._delta is None:
-            old = {}
+            # Even with nothing to merge into, fetch_value_merge() still needs
+            # to run to drop deletes, so value.updates can't be used as-is
+            updates: t.Dict[t.Any, t.Any] = {}
+            self.api_cls.naive_fetch_merge(updates, value.updates)
+            value.updates = updates
             self._delta = value
         else:
-            old = self._delta.updates
-        self.api_cls.naive_fetch_merge(old, value.updates)
-        self._delta.updates = old
-        self._delta.checkpoint = value.checkpoint
+            # Merges in place, so no need to reassign updates
+            self.api_cls.naive_fetch_merge(self._delta.updates, value.updates)
+            self._delta.checkpoint = value.checkpoint
         self.dirty = True
 
     @property
@@ -95,11 +98,13 @@ class SimpleFetchedStateStore(fetch_state.FetchedStateStoreBase):
         return self._get_state(collab).checkpoint
 
     def _get_state(self, collab: CollaborationConfigBase) -> _StateTracker:
-        if collab.name not in self._state:
-            logging.debug("Loading state for %s", collab.name)
-            delta = self._read_state(collab.name)
-            self._state[collab.name] = _StateTracker(self.api_cls, delta)
-        return self._state[collab.name]
+        name = collab.name
+        state = self._state.get(name)
+        if state is None:
+            logging.debug("Loading state for %s", name)
+            state = _StateTracker(self.api_cls, self._read_state(name))
+            self._state[name] = state
+        return state
 
     def clear(self, collab: CollaborationConfigBase) -> None:
         self._state.pop(collab.name, None)
@@ -117,31 +122,48 @@ class SimpleFetchedStateStore(fetch_state.FetchedStateStoreBase):
         """
 
         state = self._get_state(collab)
-        if len(delta.updates) == 0 and delta.checkpoint in (
-            None,
-            state.checkpoint,
+        if not delta.updates and (
+            delta.checkpoint is None or delta.checkpoint == state.checkpoint
         ):
-            logging.warning("No op update for %s", collab.name)
+            logging.debug("No op update for %s", collab.name)
             return
         state.delta = delta
 
     def flush(self) -> None:
         for collab_name, state in self._state.items():
+            # dirty is only set by the delta setter, so delta is populated
             if state.dirty:
-                assert state.delta is not None
                 self._write_state(collab_name, state.delta)
                 state.dirty = False
 
     def get_for_signal_type(
         self, collabs: t.List[CollaborationConfigBase], signal_type: t.Type[SignalType]
     ) -> t.Dict[str, t.Dict[str, fetch_state.FetchedSignalMetadata]]:
+        return {
+            collab_name: by_type[signal_type]
+            for collab_name, by_type in self.get_for_signal_types(
+                collabs, [signal_type]
+            ).items()
+        }
+
+    def get_for_signal_types(
+        self,
+        collabs: t.List[CollaborationConfigBase],
+        signal_types: t.Sequence[t.Type[SignalType]],
+    ) -> t.Dict[
+        str, t.Dict[t.Type[SignalType], t.Dict[str, fetch_state.FetchedSignalMetadata]]
+    ]:
         ret = {}
         for collab in collabs:
             state = self._get_state(collab)
             if not state.empty:
-                by_signal = state.api_cls.naive_convert_to_signal_type(
-                    [signal_type], collab, state.delta.updates
-                ).get(signal_type, {})
-                if by_signal:
-                    ret[collab.name] = by_signal
+                # One conversion pass over the updates covers every type
+                converted = state.api_cls.naive_convert_to_signal_type(
+                    signal_types, collab, state.delta.updates
+                )
+                by_type = {
+                    st: by_signal for st, by_signal in converted.items() if by_signal
+                }
+                if by_type:
+                    ret[collab.name] = by_type
         return ret
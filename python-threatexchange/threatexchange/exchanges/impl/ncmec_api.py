@@ -354,10 +354,11 @@ class NCMECSignalExchangeAPI(
             t.Tuple[api.NCMECEntryType, str], t.Type[SignalType]
         ] = _get_conversion(signal_types)
         ret: t.Dict[t.Type[SignalType], t.Dict[str, NCMECSignalMetadata]] = {}
+        only_esp_ids = collab.only_esp_ids
         for entry in fetched.values():
             if entry.deleted:
                 continue  # We expect len(fingerprints) == 0 here, but to be safe
-            if collab.only_esp_ids and entry.member_id not in collab.only_esp_ids:
+            if only_esp_ids and entry.member_id not in only_esp_ids:
                 continue
             for fingerprint_type, fingerprint_value in entry.fingerprints.items():
                 st = mapping.get((entry.entry_type, fingerprint_type))
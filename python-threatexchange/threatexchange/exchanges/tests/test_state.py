@@ -18,6 +18,7 @@ from threatexchange.exchanges.fetch_state import (
     FetchDelta,
     FetchDeltaTyped,
     FetchedSignalMetadata,
+    FetchedStateStoreBase,
     SignalOpinion,
     SignalOpinionCategory,
     TUpdateRecordKey,
@@ -218,6 +219,67 @@ def test_test_impls() -> None:
     assert store.get_for_signal_type([config], VideoMD5Signal) == {
         config.name: {md5: record}
     }
+    assert store.get_for_signal_types([config], [RawTextSignal, VideoMD5Signal]) == {
+        config.name: {VideoMD5Signal: {md5: record}}
+    }
+
+
+class FakePerTypeStore(FetchedStateStoreBase):
+    """Only implements get_for_signal_type, to exercise the base fallback"""
+
+    def __init__(
+        self,
+        by_type: t.Dict[
+            t.Type[SignalType], t.Dict[str, t.Dict[str, FetchedSignalMetadata]]
+        ],
+    ) -> None:
+        self.by_type = by_type
+
+    def get_checkpoint(
+        self, collab: CollaborationConfigBase
+    ) -> t.Optional[FetchCheckpointBase]:
+        raise NotImplementedError
+
+    def merge(self, collab: CollaborationConfigBase, delta: FetchDelta) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        raise NotImplementedError
+
+    def clear(self, collab: CollaborationConfigBase) -> None:
+        raise NotImplementedError
+
+    def get_for_signal_type(
+        self, collabs: t.List[CollaborationConfigBase], signal_type: t.Type[SignalType]
+    ) -> t.Dict[str, t.Dict[str, FetchedSignalMetadata]]:
+        names = {c.name for c in collabs}
+        return {
+            name: signals
+            for name, signals in self.by_type.get(signal_type, {}).items()
+            if name in names
+        }
+
+
+def test_get_for_signal_types_default() -> None:
+    a = CollaborationConfigWithDefaults("A", "fake")
+    b = CollaborationConfigWithDefaults("B", "fake")
+    c = CollaborationConfigWithDefaults("C", "fake")
+    a_md5 = FakeSignalMetadata()
+    a_text = FakeSignalMetadata()
+    b_md5 = FakeSignalMetadata()
+    store = FakePerTypeStore(
+        {
+            VideoMD5Signal: {a.name: {md5(1): a_md5}, b.name: {md5(2): b_md5}},
+            RawTextSignal: {a.name: {"text": a_text}},
+        }
+    )
+
+    assert store.get_for_signal_types([a, b, c], [VideoMD5Signal, RawTextSignal]) == {
+        a.name: {VideoMD5Signal: {md5(1): a_md5}, RawTextSignal: {"text": a_text}},
+        # No RawTextSignal matches for B, so no empty entry for it
+        b.name: {VideoMD5Signal: {md5(2): b_md5}},
+    }
+    assert store.get_for_signal_types([b], [RawTextSignal]) == {}
 
 
 def test_update_stream_delta() -> None:
@@ -380,6 +442,8 @@ def test_update_stream_delta() -> None:
     assert store.get_for_signal_type([collab], VideoMD5Signal) == {
         collab.name: expected_states[-1]
     }
+    # Deletes in the first fetch shouldn't be persisted
+    assert store._fake_storage[collab.name].updates.keys() == {3}
 
     store = FakeFetchStore(FakePerOwnerOpinionAPI)
     # If we appy updates 1-by-1 we expect all the end states